@@ -5,12 +5,14 @@
 """
 
 import time
-import datetime
 import os
 import sys
 import math
+import signal
+import unicodedata
 import psutil
 from collections import deque
+from itertools import islice, zip_longest
 from typing import List, Tuple
 
 
@@ -26,6 +28,15 @@ class JSTClock:
         self.BOLD = "\033[1m"
         self.CLEAR_SCREEN = "\033[2J"
         self.MOVE_CURSOR = "\033[H"
+        self.CLEAR_LINE = "\033[K"
+        self.CLEAR_BELOW = "\033[J"
+
+        # 毎フレーム同じ内容の見出しと区切り文字（見出しは表示幅と組にする）
+        self.SEPARATOR = " │ "
+        self._clock_title = self.colored_line("【アナログ時計】", self.BRIGHT_PURPLE)
+        self._cpu_title = self.colored_line("【CPU使用率】", self.BRIGHT_PURPLE)
+        self._memory_title = self.colored_line("【メモリ使用率】", self.PURPLE)
+        self._timezone_line = self.colored_line("JST (UTC+9)", self.BRIGHT_PURPLE)
 
         # アナログ時計の設定（小さく円形に）
         self.clock_radius = 5
@@ -34,28 +45,118 @@ class JSTClock:
         self.center_x = self.clock_width // 2
         self.center_y = self.clock_height // 2
 
+        # 文字盤は1次元のASCIIバイト列（行優先）で描画し、表示時に記号へ置き換える
+        self.GLYPHS = str.maketrans({"o": "●", "=": "━", "-": "─", "|": "│"})
+
+        # 外枠の判定範囲（中心からの距離の2乗で比較する）
+        ring_radius = self.clock_radius - 1
+        self._ring_lo2 = (ring_radius - 0.6) ** 2
+        self._ring_hi2 = (ring_radius + 0.6) ** 2
+
+        # 針の角度ごとのcos/sin（分針・秒針は60通り、時針は12時間×60分の720通り）
+        self._m_cos = tuple(math.cos(math.radians(m * 6 - 90)) for m in range(60))
+        self._m_sin = tuple(math.sin(math.radians(m * 6 - 90)) for m in range(60))
+        self._h_cos = tuple(math.cos(math.radians(i * 0.5 - 90)) for i in range(720))
+        self._h_sin = tuple(math.sin(math.radians(i * 0.5 - 90)) for i in range(720))
+
+        # 目盛りの位置と文字（x, y, 文字コード）
+        self._hour_marks = self._build_hour_marks()
+
+        self._face_template = self._build_face_template()
+        # 毎フレーム再利用する描画バッファ
+        self._clock_buffer = bytearray(self._face_template)
+
         # システム監視の設定
         self.graph_width = 40
         self.graph_height = 12
         self.cpu_history = deque(maxlen=self.graph_width)
         self.memory_history = deque(maxlen=self.graph_width)
 
+        # 使用率は stats_interval 回（秒）に1回だけ取得する
+        self.stats_interval = 2
+        self._stats_skipped = 0
+        self._last_stats = None
+
         # 初期データを0で埋める
         for _ in range(self.graph_width):
             self.cpu_history.append(0)
             self.memory_history.append(0)
 
+        # グラフはバイト列で描画し、記号（制御文字で表す）は表示時に置き換える
+        self.GRAPH_GLYPHS = {0x01: "●", 0x02: "│", 0x03: "─"}
+
+        # 目盛りと枠はデータに依存しないため一度だけ作成
+        self._graph_template = self._build_graph_template()
+
+        # 1フレーム分の出力行（まとめて書き込む）
+        self._frame: List[str] = []
+        # 直前に表示したフレーム（同じ内容なら書き込みを省略する）
+        self._last_frame = None
+
+        # 端末の幅はキャッシュし、ウィンドウサイズの変更時（SIGWINCH）のみ更新
+        self.update_terminal_size()
+        if hasattr(signal, "SIGWINCH"):
+            signal.signal(signal.SIGWINCH, self.update_terminal_size)
+
+    def update_terminal_size(self, *_):
+        """端末の幅を取得"""
+        self._term_width = os.get_terminal_size().columns
+        self._build_padded_lines()
+        # サイズが変わったら次のフレームは必ず描画し直す
+        self._last_frame = None
+
+    def get_display_width(self, text: str) -> int:
+        """端末上の表示幅を計算（全角文字は2桁）"""
+        return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+    def colored_line(self, text: str, color: str) -> Tuple[str, int]:
+        """色付きの行と、エスケープシーケンスを除いた表示幅の組を作成"""
+        return f"{color}{text}{self.RESET}", self.get_display_width(text)
+
+    def _build_padded_lines(self):
+        """端末の幅に合わせて中央揃えした行を作成"""
+        terminal_width = self._term_width
+        self._blank_line = " " * terminal_width
+
+        header = "🕐 日本標準時 (JST) 🕐"
+        header_width = self.get_display_width(header)
+        padding = (terminal_width - header_width) // 2
+        self._header_line = (
+            f"{' ' * padding}{header}{' ' * (terminal_width - padding - header_width)}"
+        )
+
+        footer = "Ctrl+C で終了"
+        padding = (terminal_width - self.get_display_width(footer)) // 2
+        self._footer_line = f"{self.PURPLE}{' ' * padding}{footer}{self.RESET}"
+
+        # 日付の行は表示時に作成する（日付が変わるまで再利用）
+        self._date_str = None
+        self._date_line = ""
+
     def clear_screen(self):
         """画面をクリア"""
-        # より確実な画面クリア
-        os.system("clear" if os.name == "posix" else "cls")
-
-    def get_jst_time(self) -> datetime.datetime:
+        sys.stdout.write(f"{self.CLEAR_SCREEN}{self.MOVE_CURSOR}")
+        sys.stdout.flush()
+
+    def write_line(self, line: str = ""):
+        """1行をフレームに追加（前の表示の残りは行末まで消去）"""
+        self._frame.append(f"{line}{self.CLEAR_LINE}")
+
+    def flush_frame(self):
+        """溜めたフレームを1回の書き込みで表示"""
+        # カーソルを左上に戻して前の表示に上書きし、下側の残りを消去
+        frame = "\n".join(self._frame)
+        self._frame.clear()
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
+        sys.stdout.write(f"{self.MOVE_CURSOR}{frame}\n{self.CLEAR_BELOW}")
+        sys.stdout.flush()
+
+    def get_jst_time(self) -> time.struct_time:
         """日本標準時を取得"""
         # UTCから9時間進める（JST = UTC+9）
-        utc_now = datetime.datetime.utcnow()
-        jst_now = utc_now + datetime.timedelta(hours=9)
-        return jst_now
+        return time.gmtime(time.time() + 9 * 3600)
 
     def get_hand_position(self, angle: float, length: float) -> Tuple[int, int]:
         """針の位置を計算"""
@@ -69,7 +170,7 @@ class JSTClock:
         return x, y
 
     def draw_line(
-        self, clock: List[List[str]], x1: int, y1: int, x2: int, y2: int, char: str
+        self, clock: bytearray, x1: int, y1: int, x2: int, y2: int, char: int
     ):
         """2点間に線を描画"""
         dx = abs(x2 - x1)
@@ -78,10 +179,15 @@ class JSTClock:
         x_inc = 1 if x1 < x2 else -1
         y_inc = 1 if y1 < y2 else -1
         error = dx - dy
+        width = self.clock_width
+        height = self.clock_height
+        # バッファ上の位置も座標と一緒に進める（y方向は1行分ずつ）
+        offset = y1 * width + x1
+        offset_inc = y_inc * width
 
         while True:
-            if 0 <= y < self.clock_height and 0 <= x < self.clock_width:
-                clock[y][x] = char
+            if 0 <= y < height and 0 <= x < width:
+                clock[offset] = char
 
             if x == x2 and y == y2:
                 break
@@ -90,105 +196,104 @@ class JSTClock:
             if e2 > -dy:
                 error -= dy
                 x += x_inc
+                offset += x_inc
             if e2 < dx:
                 error += dx
                 y += y_inc
+                offset += offset_inc
 
     def get_system_stats(self):
         """システム使用率を取得"""
+        # 取得しない回は /proc を読まずに前回の値を返す
+        if (
+            self._last_stats is not None
+            and self._stats_skipped < self.stats_interval - 1
+        ):
+            self._stats_skipped += 1
+            return self._last_stats
+
         cpu_percent = psutil.cpu_percent(interval=None)
         memory_percent = psutil.virtual_memory().percent
 
-        self.cpu_history.append(cpu_percent)
-        self.memory_history.append(memory_percent)
-
-        return cpu_percent, memory_percent
-
-    def create_graph(self, data: deque, title: str, color: str) -> List[str]:
-        """折れ線グラフを作成"""
+        # 取得しなかった回の分は前回の値との間を線形補間して履歴に追加
+        steps = self._stats_skipped + 1
+        last_cpu = self.cpu_history[-1]
+        last_memory = self.memory_history[-1]
+        for k in range(1, steps + 1):
+            self.cpu_history.append(last_cpu + (cpu_percent - last_cpu) * k / steps)
+            self.memory_history.append(
+                last_memory + (memory_percent - last_memory) * k / steps
+            )
+
+        self._stats_skipped = 0
+        self._last_stats = (cpu_percent, memory_percent)
+        return self._last_stats
+
+    def _build_graph_template(self) -> Tuple[bytearray, ...]:
+        """データに依存しないグラフの部分（目盛りと枠）を作成"""
         graph = [
-            [" " for _ in range(self.graph_width + 10)]
+            bytearray(b" " * (self.graph_width + 10))
             for _ in range(self.graph_height + 3)
         ]
 
-        # タイトル
-        title_line = f"{color}{title}{self.RESET}"
-        for i, char in enumerate(title):
-            if i < len(title):
-                graph[0][i] = char
-
         # Y軸の目盛り（0-100%）
         for i in range(self.graph_height):
             y_value = 100 - (i * 100 // (self.graph_height - 1))
             y_label = f"{y_value:3d}%"
-            for j, char in enumerate(y_label):
-                if j < 4:
-                    graph[i + 2][j] = char
+            graph[i + 2][:4] = y_label[:4].encode()
 
         # グラフの枠
         for i in range(self.graph_height):
-            graph[i + 2][5] = "│"
-
-        for j in range(self.graph_width):
-            graph[self.graph_height + 1][j + 6] = "─"
+            graph[i + 2][5] = 0x02
 
-        # データをプロット
-        if len(data) > 1:
-            for i in range(1, len(data)):
-                if data[i - 1] is not None and data[i] is not None:
-                    # Y座標を計算（上下反転）
-                    y1 = (
-                        self.graph_height
-                        - int((data[i - 1] / 100) * (self.graph_height - 1))
-                        + 1
-                    )
-                    y2 = (
-                        self.graph_height
-                        - int((data[i] / 100) * (self.graph_height - 1))
-                        + 1
-                    )
+        graph[self.graph_height + 1][6 : self.graph_width + 6] = (
+            b"\x03" * self.graph_width
+        )
 
-                    x1 = i - 1 + 6
-                    x2 = i + 6
-
-                    # 線を描画
-                    if (
-                        0 <= y1 < self.graph_height + 2
-                        and 0 <= y2 < self.graph_height + 2
-                    ):
-                        if abs(y2 - y1) <= 1:
-                            # 水平に近い場合
-                            if x2 < self.graph_width + 6:
-                                graph[y2][x2] = "●"
-                        else:
-                            # 垂直線を描画
-                            start_y = min(y1, y2)
-                            end_y = max(y1, y2)
-                            for y in range(start_y, end_y + 1):
-                                if (
-                                    y < self.graph_height + 2
-                                    and x2 < self.graph_width + 6
-                                ):
-                                    graph[y][x2] = "│"
+        return tuple(graph)
 
-        # 文字列に変換
-        return ["".join(row).rstrip() for row in graph]
+    def create_graph(self, data: deque, title: str, color: str) -> List[str]:
+        """折れ線グラフを作成"""
+        # 目盛りと枠はテンプレートから複製する
+        graph = [row[:] for row in self._graph_template]
 
-    def create_clock_face(self, hour: int, minute: int, second: int) -> List[str]:
-        """アナログ時計の文字盤を作成"""
-        clock = [
-            [" " for _ in range(self.clock_width)] for _ in range(self.clock_height)
+        # タイトル
+        title_bytes = title.encode()
+        graph[0][: len(title_bytes)] = title_bytes
+
+        # Y座標をまとめて計算（上下反転）
+        height = self.graph_height
+        ys = [
+            None if value is None else height - int((value / 100) * (height - 1)) + 1
+            for value in data
         ]
 
-        # 時計の外枠を描画（真円に近づける）
-        for i in range(self.clock_height):
-            for j in range(self.clock_width):
-                dx = j - self.center_x
-                dy = i - self.center_y
-                distance = math.sqrt(dx * dx + dy * dy)
+        # データをプロット
+        max_y = self.graph_height + 2
+        max_x = self.graph_width + 6
+        for i in range(1, len(ys)):
+            y1 = ys[i - 1]
+            y2 = ys[i]
+            x2 = i + 6
+            if y1 is None or y2 is None or x2 >= max_x:
+                continue
+
+            # 線を描画
+            if 0 <= y1 < max_y and 0 <= y2 < max_y:
+                if abs(y2 - y1) <= 1:
+                    # 水平に近い場合
+                    graph[y2][x2] = 0x01
+                else:
+                    # 垂直線を描画
+                    for y in range(min(y1, y2), max(y1, y2) + 1):
+                        graph[y][x2] = 0x02
+
+        # 文字列に変換
+        return [row.rstrip().decode().translate(self.GRAPH_GLYPHS) for row in graph]
 
-                if abs(distance - (self.clock_radius - 1)) < 0.6:
-                    clock[i][j] = "●"
+    def _build_hour_marks(self) -> List[Tuple[int, int, int]]:
+        """目盛りの座標と文字の一覧を作成"""
+        marks = []
 
         # 主要な時刻のみ表示（12, 3, 6, 9時）
         main_hours = [0, 3, 6, 9]
@@ -201,76 +306,87 @@ class JSTClock:
 
             if 0 <= mark_y < self.clock_height and 0 <= mark_x < self.clock_width:
                 if h == 0:
-                    clock[mark_y][mark_x] = "12"[0]
+                    marks.append((mark_x, mark_y, ord("1")))
                     if mark_x + 1 < self.clock_width:
-                        clock[mark_y][mark_x + 1] = "12"[1]
+                        marks.append((mark_x + 1, mark_y, ord("2")))
                 else:
-                    clock[mark_y][mark_x] = str(h if h != 0 else 12)
-
-        # 針の角度を計算
-        hour_angle = (hour % 12) * 30 + minute * 0.5
-        minute_angle = minute * 6
-        second_angle = second * 6
-
-        # 時針を描画（短い）
-        hour_radian = math.radians(hour_angle - 90)
-        hour_x = self.center_x + int(self.clock_radius * 0.4 * math.cos(hour_radian))
-        hour_y = self.center_y + int(self.clock_radius * 0.4 * math.sin(hour_radian))
-        self.draw_line(clock, self.center_x, self.center_y, hour_x, hour_y, "━")
-
-        # 分針を描画（長い）
-        minute_radian = math.radians(minute_angle - 90)
-        minute_x = self.center_x + int(
-            self.clock_radius * 0.7 * math.cos(minute_radian)
-        )
-        minute_y = self.center_y + int(
-            self.clock_radius * 0.7 * math.sin(minute_radian)
-        )
-        self.draw_line(clock, self.center_x, self.center_y, minute_x, minute_y, "─")
+                    marks.append((mark_x, mark_y, ord(str(h))))
+
+        return marks
 
-        # 秒針を描画（最も長い、細い）
-        second_radian = math.radians(second_angle - 90)
-        second_x = self.center_x + int(
-            self.clock_radius * 0.8 * math.cos(second_radian)
+    def _build_face_template(self) -> bytes:
+        """時刻に依存しない文字盤（外枠と目盛り）を作成"""
+        # 時計の外枠を描画（真円に近づける）
+        # 行・列ごとの中心からの距離の2乗を先に求め、まとめて生成する
+        dx2 = [(j - self.center_x) ** 2 for j in range(self.clock_width)]
+        dy2 = [(i - self.center_y) ** 2 for i in range(self.clock_height)]
+        ring, blank = ord("o"), ord(" ")
+        clock = bytearray(
+            ring if self._ring_lo2 < x2 + y2 < self._ring_hi2 else blank
+            for y2 in dy2
+            for x2 in dx2
         )
-        second_y = self.center_y + int(
-            self.clock_radius * 0.8 * math.sin(second_radian)
+
+        # 目盛り
+        for mark_x, mark_y, char in self._hour_marks:
+            clock[mark_y * self.clock_width + mark_x] = char
+
+        return bytes(clock)
+
+    def create_clock_face(self, hour: int, minute: int, second: int) -> List[str]:
+        """アナログ時計の文字盤を作成"""
+        # 外枠と目盛りをテンプレートから描画バッファへ書き戻す
+        clock = self._clock_buffer
+        clock[:] = self._face_template
+
+        # 針の角度に対応するcos/sinを表から取得
+        hour_index = (hour % 12) * 60 + minute
+
+        # 時針（短い）、分針（長い）、秒針（最も長い、細い）の順に描画
+        hands = (
+            (self._h_cos[hour_index], self._h_sin[hour_index], 0.4, ord("=")),
+            (self._m_cos[minute], self._m_sin[minute], 0.7, ord("-")),
+            (self._m_cos[second], self._m_sin[second], 0.8, ord("|")),
         )
-        self.draw_line(clock, self.center_x, self.center_y, second_x, second_y, "│")
+        for cos, sin, ratio, char in hands:
+            hand_x = self.center_x + int(self.clock_radius * ratio * cos)
+            hand_y = self.center_y + int(self.clock_radius * ratio * sin)
+            self.draw_line(clock, self.center_x, self.center_y, hand_x, hand_y, char)
 
         # 中心点
-        clock[self.center_y][self.center_x] = "●"
+        clock[self.center_y * self.clock_width + self.center_x] = ord("o")
 
-        # 文字列に変換
-        return ["".join(row) for row in clock]
+        # 文字列に変換（置き換えは1文字ずつなので行の幅は変わらない）
+        text = clock.decode().translate(self.GLYPHS)
+        width = self.clock_width
+        return [text[i : i + width] for i in range(0, len(text), width)]
 
-    def display_split_screen(self, jst_time: datetime.datetime):
+    def display_split_screen(self, jst_time: time.struct_time):
         """画面を分割して時計とグラフを表示"""
         # システム使用率を取得
         cpu_percent, memory_percent = self.get_system_stats()
 
         # 時計を作成
-        hour = jst_time.hour
-        minute = jst_time.minute
-        second = jst_time.second
+        hour = jst_time.tm_hour
+        minute = jst_time.tm_min
+        second = jst_time.tm_sec
         clock_lines = self.create_clock_face(hour, minute, second)
 
-        # 時計の下にデジタル時刻とタイムゾーンを追加
-        time_str = jst_time.strftime("%H:%M:%S")
-        timezone_str = "JST (UTC+9)"
-        clock_lines.append("")
-        clock_lines.append(f"{self.PURPLE}{time_str}{self.RESET}")
-        clock_lines.append(f"{self.BRIGHT_PURPLE}{timezone_str}{self.RESET}")
+        # 各セクションの行は（表示する文字列, 表示幅）の組で持ち、
+        # 色のエスケープシーケンスを含む行も正しい幅で揃える
+        clock_section = [self._clock_title]
+        clock_section += [(line, self.clock_width) for line in clock_lines]
 
-        # 時計セクションを固定の高さにする
-        clock_section = [
-            f"{self.BRIGHT_PURPLE}【アナログ時計】{self.RESET}"
-        ] + clock_lines
+        # 時計の下にデジタル時刻とタイムゾーンを追加
+        time_str = f"{hour:02d}:{minute:02d}:{second:02d}"
+        clock_section.append(("", 0))
+        clock_section.append(self.colored_line(time_str, self.PURPLE))
+        clock_section.append(self._timezone_line)
 
         # 時計セクションを固定の高さ（15行）にパディング
         clock_fixed_height = 15
         while len(clock_section) < clock_fixed_height:
-            clock_section.append("")
+            clock_section.append(("", 0))
 
         # グラフを作成
         cpu_graph = self.create_graph(
@@ -281,10 +397,11 @@ class JSTClock:
         )
 
         # CPUグラフにタイトルを追加
-        cpu_section = [f"{self.BRIGHT_PURPLE}【CPU使用率】{self.RESET}"] + cpu_graph
+        cpu_section = [self._cpu_title] + [(line, len(line)) for line in cpu_graph]
 
         # メモリグラフにタイトルを追加
-        memory_section = [f"{self.PURPLE}【メモリ使用率】{self.RESET}"] + memory_graph
+        memory_section = [self._memory_title]
+        memory_section += [(line, len(line)) for line in memory_graph]
 
         # 各セクションの幅を設定
         clock_width = 20
@@ -293,86 +410,67 @@ class JSTClock:
         # 最大行数を計算（時計セクションは固定高さを使用）
         max_lines = max(clock_fixed_height, len(cpu_section), len(memory_section))
 
-        print(f"{self.BOLD}")
-        for i in range(max_lines):
-            line_parts = []
-
-            # 左側：時計（固定高さ）
-            if i < len(clock_section):
-                clock_content = clock_section[i]
-            else:
-                clock_content = ""
-            line_parts.append(clock_content.ljust(clock_width))
-
-            # 区切り文字
-            line_parts.append(" │ ")
-
-            # 中央：CPUグラフ
-            if i < len(cpu_section):
-                cpu_content = cpu_section[i]
-            else:
-                cpu_content = ""
-            line_parts.append(cpu_content.ljust(graph_width))
-
-            # 区切り文字
-            line_parts.append(" │ ")
-
-            # 右側：メモリグラフ
-            if i < len(memory_section):
-                memory_content = memory_section[i]
-            else:
-                memory_content = ""
-            line_parts.append(memory_content)
-
-            # 行を結合して表示
-            print("".join(line_parts))
+        # 行数の足りないセクションは空文字で埋めて横に並べる
+        # （左側：時計、中央：CPUグラフ、右側：メモリグラフ）
+        rows = zip_longest(
+            clock_section, cpu_section, memory_section, fillvalue=("", 0)
+        )
+        separator = self.SEPARATOR
+        self.write_line(self.BOLD)
+        for clock_content, cpu_content, memory_content in islice(rows, max_lines):
+            self.write_line(
+                "".join(
+                    (
+                        clock_content[0],
+                        " " * (clock_width - clock_content[1]),
+                        separator,
+                        cpu_content[0],
+                        " " * (graph_width - cpu_content[1]),
+                        separator,
+                        memory_content[0],
+                    )
+                )
+            )
 
-        print(self.RESET)
+        self.write_line(self.RESET)
 
-    def display_date_info(self, jst_time: datetime.datetime):
+    def display_date_info(self, jst_time: time.struct_time):
         """日付情報を表示"""
         weekdays = ["月", "火", "水", "木", "金", "土", "日"]
-        weekday = weekdays[jst_time.weekday()]
+        weekday = weekdays[jst_time.tm_wday]
 
-        date_str = f"{jst_time.year}年{jst_time.month}月{jst_time.day}日 ({weekday})"
+        date_str = (
+            f"{jst_time.tm_year}年{jst_time.tm_mon}月{jst_time.tm_mday}日 ({weekday})"
+        )
 
-        # 中央揃えで表示
-        terminal_width = os.get_terminal_size().columns
-        padding = (terminal_width - len(date_str)) // 2
+        # 中央揃えで表示（日付が変わったときだけ作り直す）
+        if date_str != self._date_str:
+            padding = (self._term_width - self.get_display_width(date_str)) // 2
+            self._date_str = date_str
+            self._date_line = f"{self.PURPLE}{' ' * padding}{date_str}{self.RESET}"
 
-        print(f"{self.PURPLE}{' ' * padding}{date_str}{self.RESET}")
-        print()
+        self.write_line(self._date_line)
+        self.write_line()
 
     def display_header(self):
         """ヘッダーを表示"""
-        header = "🕐 日本標準時 (JST) 🕐"
-        terminal_width = os.get_terminal_size().columns
-        padding = (terminal_width - len(header)) // 2
-
-        print(f"{self.BG_PURPLE}{self.BLACK}{self.BOLD}")
-        print(f"{' ' * terminal_width}")
-        print(
-            f"{' ' * padding}{header}{' ' * (terminal_width - padding - len(header))}"
-        )
-        print(f"{' ' * terminal_width}")
-        print(self.RESET)
-        print()
+        self.write_line(f"{self.BG_PURPLE}{self.BLACK}{self.BOLD}")
+        self.write_line(self._blank_line)
+        self.write_line(self._header_line)
+        self.write_line(self._blank_line)
+        self.write_line(self.RESET)
+        self.write_line()
 
     def display_footer(self):
         """フッターを表示"""
-        footer = "Ctrl+C で終了"
-        terminal_width = os.get_terminal_size().columns
-        padding = (terminal_width - len(footer)) // 2
-
-        print()
-        print(f"{self.PURPLE}{' ' * padding}{footer}{self.RESET}")
+        self.write_line()
+        self.write_line(self._footer_line)
 
     def run(self):
         """メインループ"""
         try:
+            self.clear_screen()
             while True:
-                self.clear_screen()
-
                 # 現在のJST時刻を取得
                 jst_time = self.get_jst_time()
 
@@ -380,9 +478,11 @@ class JSTClock:
                 self.display_date_info(jst_time)
                 self.display_split_screen(jst_time)
                 self.display_footer()
+                self.flush_frame()
 
-                # 1秒待機
-                time.sleep(1)
+                # 次の秒の切り替わりまで待機（描画時間の分だけずれないように）
+                # 毎回現在時刻から求めるので、時刻が前後に変わっても1秒以内に戻る
+                time.sleep(1 - time.time() % 1)
 
         except KeyboardInterrupt:
             self.clear_screen()